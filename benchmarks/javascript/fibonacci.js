@@ -1,14 +1,24 @@
 #!/usr/bin/env bun
 
-// Fibonacci benchmark in JavaScript
+// Fibonacci benchmark in JavaScript (iterative version)
 
 function fibonacci(n) {
     if (n <= 1) {
         return n;
     }
-    return fibonacci(n - 1) + fibonacci(n - 2);
+
+    let a = 0;
+    let b = 1;
+    let i = 2;
+    while (i <= n) {
+        const temp = a + b;
+        a = b;
+        b = temp;
+        i = i + 1;
+    }
+    return b;
 }
 
 // Calculate fibonacci of 35 (reasonable time for benchmarking)
 const result = fibonacci(35);
-console.log(result);
\ No newline at end of file
+console.log(result);
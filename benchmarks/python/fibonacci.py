@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 
-# Fibonacci benchmark in Python
+# Fibonacci benchmark in Python (iterative version)
 
 def fibonacci(n):
     if n <= 1:
         return n
-    return fibonacci(n-1) + fibonacci(n-2)
+
+    a = 0
+    b = 1
+    i = 2
+    while i <= n:
+        temp = a + b
+        a = b
+        b = temp
+        i += 1
+    return b
 
 # Calculate fibonacci of 35 (reasonable time for benchmarking)
 result = fibonacci(35)
@@ -36,20 +36,20 @@ class Colors:
             ascii_text = text.encode('ascii', 'replace').decode('ascii')
             print(ascii_text, end=end)
 
-def run_benchmark(name, neutron_bin, neutron_file, python_file, js_file=None, neutron_extra_args=None):
+def run_benchmark(name, neutron_bin, neutron_file, python_file, js_file=None, neutron_extra_args=None, python_bin=None):
     results = {}
     
     # Run Python version
-    python_start = time.time()
+    python_start = time.perf_counter()
     try:
         python_result = subprocess.run(
-            [sys.executable, python_file],
+            [python_bin or sys.executable, python_file],
             capture_output=True,
             text=True,
             encoding='utf-8',
             errors='replace'
         )
-        python_end = time.time()
+        python_end = time.perf_counter()
         
         if python_result.returncode == 0:
             python_time = python_end - python_start
@@ -75,7 +75,7 @@ def run_benchmark(name, neutron_bin, neutron_file, python_file, js_file=None, ne
         }
 
     # Run Neutron version
-    neutron_start = time.time()
+    neutron_start = time.perf_counter()
     try:
         neutron_cmd = [neutron_bin, neutron_file]
         if neutron_extra_args:
@@ -87,7 +87,7 @@ def run_benchmark(name, neutron_bin, neutron_file, python_file, js_file=None, ne
             encoding='utf-8',
             errors='replace'
         )
-        neutron_end = time.time()
+        neutron_end = time.perf_counter()
         
         if neutron_result.returncode == 0:
             neutron_time = neutron_end - neutron_start
@@ -114,7 +114,7 @@ def run_benchmark(name, neutron_bin, neutron_file, python_file, js_file=None, ne
 
     # Run JS version with Bun (if available and file exists)
     if js_file and os.path.exists(js_file) and shutil.which('bun'):
-        js_start = time.time()
+        js_start = time.perf_counter()
         try:
             js_result = subprocess.run(
                 ['bun', 'run', js_file],
@@ -123,7 +123,7 @@ def run_benchmark(name, neutron_bin, neutron_file, python_file, js_file=None, ne
                 encoding='utf-8',
                 errors='replace'
             )
-            js_end = time.time()
+            js_end = time.perf_counter()
             
             if js_result.returncode == 0:
                 js_time = js_end - js_start
@@ -260,6 +260,8 @@ def main():
     import argparse
     parser = argparse.ArgumentParser(description="Neutron Benchmark Suite")
     parser.add_argument('--no-jit', action='store_true', help='Disable JIT compilation for Neutron benchmarks')
+    parser.add_argument('--python', metavar='INTERP', default=None,
+                        help='Python interpreter for the Python benchmarks (e.g. pypy3); defaults to the one running this script')
     args = parser.parse_args()
 
     # Script lives in benchmarks/, root is one level up
@@ -286,6 +288,14 @@ def main():
         Colors.print(f"Neutron binary not found. Please build the project first.", Colors.RED)
         sys.exit(1)
 
+    # Resolve the Python interpreter (CPython running this script unless overridden)
+    python_bin = sys.executable
+    if args.python:
+        python_bin = shutil.which(args.python)
+        if not python_bin:
+            Colors.print(f"Python interpreter '{args.python}' not found in PATH.", Colors.RED)
+            sys.exit(1)
+
     # Check for Bun
     bun_available = shutil.which('bun') is not None
     
@@ -298,17 +308,28 @@ def main():
         ver_out = subprocess.run([neutron_bin, '--version'], capture_output=True, text=True)
         match = re.search(r'Neutron\s+([\d.\-\w]+)', ver_out.stdout)
         neutron_ver = match.group(1) if match else "unknown"
-    except:
+    except (OSError, subprocess.SubprocessError):
         neutron_ver = "unknown"
     jit_label = " (JIT disabled)" if args.no_jit else ""
     Colors.print(f"🚀 Neutron: {neutron_ver}{jit_label}", Colors.BLUE)
-    Colors.print(f"🐍 Python:  {sys.version.split()[0]}", Colors.BLUE)
+    if python_bin == sys.executable:
+        python_ver = sys.version.split()[0]
+    else:
+        try:
+            # Ask the interpreter itself so the banner names the implementation (PyPy vs CPython)
+            py_out = subprocess.run(
+                [python_bin, '-c', 'import platform; print(platform.python_implementation(), platform.python_version())'],
+                capture_output=True, text=True)
+            python_ver = py_out.stdout.strip() if py_out.returncode == 0 and py_out.stdout.strip() else "unknown"
+        except (OSError, subprocess.SubprocessError):
+            python_ver = "unknown"
+    Colors.print(f"🐍 Python:  {python_ver}", Colors.BLUE)
     if bun_available:
         try:
             bun_version = subprocess.run(['bun', '--version'], capture_output=True, text=True)
             bun_ver = bun_version.stdout.strip() if bun_version.returncode == 0 else "unknown"
             Colors.print(f"⚡ Bun:     {bun_ver}", Colors.BLUE)
-        except:
+        except (OSError, subprocess.SubprocessError):
             Colors.print(f"⚡ Bun:     available", Colors.BLUE)
     else:
         Colors.print(f"⚡ Bun:     not available (install from https://bun.sh)", Colors.YELLOW)
@@ -381,7 +402,8 @@ def main():
                  os.path.join(bench_dir, n_file), 
                  os.path.join(bench_dir, p_file),
                  js_path,
-                 neutron_extra_args=extra_args
+                 neutron_extra_args=extra_args,
+                 python_bin=python_bin
              )
              total_benchmarks += 1
 
@@ -11,13 +11,79 @@ import argparse
 import zipfile
 import re
 import time
+import random
+import functools
+import concurrent.futures
+import mmap
+import hashlib
+import json
+import stat
+import shlex
+import threading
+
+# Host platform, resolved once and reused below
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == "Windows"
 
 # Set UTF-8 encoding for stdout on Windows
-if platform.system() == "Windows":
+if IS_WINDOWS:
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Cores this process may run on (honours taskset/cgroup affinity on Linux)
+CPU_COUNT = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+
+# Resolved pkg-config executable (None if not installed); spawned by path so exec skips the PATH search
+PKG_CONFIG = shutil.which("pkg-config")
+
+# Ninja, used as the CMake generator on Unix when installed (faster to generate and to no-op build)
+NINJA = shutil.which("ninja")
+
+# Compiler cache wrapped around every compile when installed (sccache preferred, then ccache);
+# their cache location settings (CCACHE_DIR, SCCACHE_DIR, ...) reach them through the inherited environment
+COMPILER_LAUNCHER = shutil.which("sccache") or shutil.which("ccache")
+
+# Held by build_neutron/build_box while configuring, so concurrent builds only overlap in compiling
+CONFIGURE_LOCK = threading.Lock()
+
+# vcpkg triplet for the host
+VCPKG_TRIPLET = 'x64-windows' if IS_WINDOWS else ('x64-osx' if SYSTEM == "Darwin" else 'x64-linux')
+
+# Creation flag that keeps short-lived tool probes from spawning a console window (0 off Windows)
+NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# Patterns compiled once at import
+# NSIS 'File' line whose quoted path contains a glob, e.g.  File "build\Release\*.dll"
+NSI_FILE_GLOB_RE = re.compile(r'^(\s*File\b[^\"]*\"([^\"]*\*[^\"]*)\".*)$', flags=re.IGNORECASE)
+# Everything _handle_vcpkg_manifest_log looks for in the vcpkg log, as one alternation so a single
+# finditer pass classifies the whole log (bytes: the log is scanned through mmap without decoding it):
+#   archive  - line naming a broken archive, e.g.  ERROR: C:\...\PowerShell-7.5.4-win-x64.zip
+#              (a lookahead, so tokens later on the same line are still seen)
+#   sevenzip - 7-Zip / extraction tool failures
+#   pwsh     - PowerShell runtime failures; pwsh_core and failed count only when both appear
+VCPKG_LOG_RE = re.compile(
+    rb'(?P<archive>(?=ERROR:\s*(?P<path>.+\.(?:zip|tar|tgz|gz|xz|7z))))'
+    rb'|(?P<pwsh>pwsh\.exe failed|pwsh\.dll)'
+    rb'|(?P<sevenzip>7zip|codec load error|7z\.dll)'
+    rb'|(?P<pwsh_core>powershell-core)'
+    rb'|(?P<failed>failed)',
+    flags=re.IGNORECASE)
+# Build artifacts swept from the project tree by clean_project (case-insensitive where the filesystem is)
+ARTIFACT_RE = re.compile(r'\.(dll|lib|a|so|dylib|obj|exe|pdb|ilk|exp)$', flags=re.IGNORECASE if IS_WINDOWS else 0)
+# Files whose changes invalidate a CMake configure (checked against CMakeCache.txt's mtime)
+CMAKE_INPUT_RE = re.compile(r'^(CMakeLists\.txt|CMakePresets\.json|vcpkg\.json)$|\.cmake$')
+CMAKE_INPUT_EXCLUDE_DIRS = {'.git', 'node_modules', 'vcpkg', 'vcpkg_installed', 'build'}
+# Files whose changes mean the binaries need rebuilding (sources plus the CMake inputs above)
+BUILD_INPUT_RE = re.compile(r'\.(c|cc|cpp|cxx|h|hh|hpp|hxx|inl|ipp|in|rc|def|cmake)$'
+                            r'|^(CMakeLists\.txt|CMakePresets\.json|vcpkg\.json)$')
+# Unix libraries staged into the package, including versioned names such as libfoo.so.1.2
+UNIX_LIB_RE = re.compile(r'\.(a|so|dylib)(\..*)?$')
+# First x.y.z in `neutron --version` output, e.g. "Neutron 26.5.0-beta (Linux)"
+VERSION_RE = re.compile(rb'(\d+\.\d+\.\d+)')
+# vcpkg tools folder name derived from a PowerShell download, e.g. powershell-core-7.5.4-win
+POWERSHELL_TOOL_RE = re.compile(r'(powershell[-_].*?\d[\d\.\-]*[-_]?win)', flags=re.IGNORECASE)
+
 # Colors
 class Colors:
     RED = '\033[0;31m'
@@ -26,16 +92,22 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'
 
+    # Resolved once at import instead of an isatty() syscall per printed line
+    ENABLED = sys.stdout.isatty() and not IS_WINDOWS
+    # Builds run in worker threads; keep their status lines from interleaving
+    LOCK = threading.Lock()
+
     @staticmethod
     def print(text, color=NC):
-        try:
-            if sys.stdout.isatty() and platform.system() != "Windows":
-                print(f"{color}{text}{Colors.NC}")
-            else:
-                print(text)
-        except UnicodeEncodeError:
-            # Fallback for Windows console encoding issues
-            print(text.encode('ascii', 'replace').decode('ascii'))
+        with Colors.LOCK:
+            try:
+                if Colors.ENABLED:
+                    print(f"{color}{text}{Colors.NC}")
+                else:
+                    print(text)
+            except UnicodeEncodeError:
+                # Fallback for Windows console encoding issues
+                print(text.encode('ascii', 'replace').decode('ascii'))
 
 def remove_readonly(func, path, excinfo):
     import stat
@@ -43,6 +115,12 @@ def remove_readonly(func, path, excinfo):
     os.chmod(path, stat.S_IWRITE)
     func(path)
 
+# Substrings marking MinGW/MSYS toolchain directories that clash with MSVC
+MINGW_PATH_RE = re.compile(r'mingw|msys', flags=re.IGNORECASE)
+
+def is_mingw_path(path):
+    return MINGW_PATH_RE.search(path) is not None
+
 def sanitize_path_for_msvc(os_type):
     # On Windows, sanitize PATH to avoid MinGW/MSYS conflicts when using MSVC
     if os_type == "windows":
@@ -51,16 +129,17 @@ def sanitize_path_for_msvc(os_type):
         # Determine where cmake is currently
         cmake_path = shutil.which("cmake")
         cmake_dir = os.path.dirname(cmake_path) if cmake_path else None
+        # Normalized once; only MinGW/MSYS entries are ever compared against it
+        cmake_dir_nc = os.path.normcase(cmake_dir) if cmake_dir else None
         
         new_path = []
         for p in os.environ["PATH"].split(os.pathsep):
             # Filter out MinGW/MSYS paths
-            lower_p = p.lower()
-            if "mingw" in lower_p or "msys" in lower_p:
+            if is_mingw_path(p):
                 # If cmake is in this directory, we might need to keep it, 
                 # OR we copy it/assume user has another cmake. 
                 # If we must use MSYS cmake, we keep it but warn.
-                if cmake_dir and os.path.normcase(p) == os.path.normcase(cmake_dir):
+                if cmake_dir_nc and os.path.normcase(p) == cmake_dir_nc:
                     Colors.print(f"Keeping CMake at {p}", Colors.BLUE)
                     new_path.append(p)
                     continue
@@ -75,7 +154,7 @@ def sanitize_path_for_msvc(os_type):
                  # Just clear them or filter? Safest to clear if we suspect pollution
                  # but if we are in VS Dev Prompt, INCLUDE has MSVC paths.
                  parts = os.environ[var].split(os.pathsep)
-                 new_parts = [p for p in parts if "mingw" not in p.lower() and "msys" not in p.lower()]
+                 new_parts = [p for p in parts if not is_mingw_path(p)]
                  os.environ[var] = os.pathsep.join(new_parts)
         
     return True
@@ -83,10 +162,7 @@ def sanitize_path_for_msvc(os_type):
 def run_command(command, cwd=None, fail_exit=True, env=None):
     try:
         Colors.print(f"Running: {' '.join(command)}", Colors.BLUE)
-        # Use sanitized env if not provided
-        if env is None:
-            env = os.environ.copy()
-            
+        # env=None inherits os.environ (already sanitized in place), so no per-call copy is needed
         subprocess.check_call(command, cwd=cwd, env=env)
         return True
     except subprocess.CalledProcessError:
@@ -95,8 +171,9 @@ def run_command(command, cwd=None, fail_exit=True, env=None):
             sys.exit(1)
         return False
 
+@functools.lru_cache(maxsize=1)
 def get_os_info():
-    system = platform.system().lower()
+    system = SYSTEM.lower()
     machine = platform.machine().lower()
     
     os_type = "unknown"
@@ -130,8 +207,7 @@ def get_os_info():
     
     return os_type, arch_type
 
-    return os_type, arch_type
-
+@functools.lru_cache(maxsize=1)
 def get_cmake_command():
     # Check if cmake is in PATH
     if shutil.which("cmake"):
@@ -152,91 +228,137 @@ def get_cmake_command():
     return "cmake" # Fallback to hoping it's in PATH or will fail later
 
 
+# Helper: waits between retries of an operation that may hit a transient lock.
+# Yields 0 first, then jittered delays doubling from `first` up to `cap`, until `timeout` seconds pass.
+# Short locks (AV scanners, indexers) are usually released within milliseconds, long ones still get the full window.
+def backoff_delays(timeout=5.0, first=0.01, cap=0.5):
+    deadline = time.monotonic() + timeout
+    delay = 0
+    while time.monotonic() < deadline:
+        yield delay
+        delay = min(cap, max(first, delay * 2)) + random.uniform(0, first)
+
+
 # Helper: try to remove a file with retries in case another process temporarily locks it
-def safe_remove(path, retries=10, delay=0.5):
-    import time
-    for i in range(retries):
+def safe_remove(path, timeout=5.0):
+    attempts = 0
+    for delay in backoff_delays(timeout):
+        time.sleep(delay)
+        attempts += 1
         try:
-            if os.path.exists(path):
-                os.remove(path)
+            os.remove(path)
+            return True
+        except FileNotFoundError:
             return True
         except PermissionError:
-            Colors.print(f"File {path} is locked; retrying ({i+1}/{retries})...", Colors.YELLOW)
-            time.sleep(delay)
+            Colors.print(f"File {path} is locked; retrying (attempt {attempts})...", Colors.YELLOW)
         except OSError as e:
             Colors.print(f"Failed to remove {path}: {e}", Colors.RED)
             return False
-    Colors.print(f"Unable to remove {path} after {retries} attempts.", Colors.RED)
+    Colors.print(f"Unable to remove {path} after {attempts} attempts.", Colors.RED)
     return False
 
 
 # Sanitize an NSIS script by commenting-out 'File' lines that reference globs with no matches
 def sanitize_nsi_for_globs(src_nsi, dst_nsi, root_dir):
-    import re
-    pattern = re.compile(r'^(\s*File\b[^\"]*\"([^\"]*\*[^\"]*)\".*)$', flags=re.IGNORECASE)
-    changed = False
-    with open(src_nsi, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    out_lines = []
-    for line in lines:
-        m = pattern.match(line)
-        if m:
-            full_line = m.group(1)
-            glob_path = m.group(2)
-            # Normalize NSIS path separators to OS separators
-            candidate = os.path.normpath(os.path.join(root_dir, glob_path)) if not os.path.isabs(glob_path) else os.path.normpath(glob_path)
-            matches = glob.glob(candidate)
-            if len(matches) == 0:
-                # Comment out the line so makensis won't warn
-                out_lines.append('; ' + line)
-                changed = True
-                continue
-        out_lines.append(line)
+    import fnmatch
 
-    with open(dst_nsi, 'w', encoding='utf-8') as f:
-        f.writelines(out_lines)
+    changed = False
+    # Directory listings, read once per directory and shared by every File line that globs into it
+    listings = {}
+
+    def glob_has_match(pattern):
+        dirname, basename = os.path.split(pattern)
+        if glob.has_magic(dirname):
+            return bool(glob.glob(pattern))
+        if dirname not in listings:
+            try:
+                listings[dirname] = os.listdir(dirname)
+            except OSError:
+                listings[dirname] = []
+        names = listings[dirname]
+        if not basename.startswith('.'):
+            # Like glob, wildcards don't match hidden files
+            names = [n for n in names if not n.startswith('.')]
+        return bool(fnmatch.filter(names, basename))
+
+    # Stream line by line; only the current line is held in memory
+    with open(src_nsi, 'r', encoding='utf-8') as fin, open(dst_nsi, 'w', encoding='utf-8') as fout:
+        for line in fin:
+            m = NSI_FILE_GLOB_RE.match(line)
+            if m:
+                glob_path = m.group(2)
+                # Normalize NSIS path separators to OS separators
+                candidate = os.path.normpath(os.path.join(root_dir, glob_path)) if not os.path.isabs(glob_path) else os.path.normpath(glob_path)
+                if not glob_has_match(candidate):
+                    # Comment out the line so makensis won't warn
+                    fout.write('; ' + line)
+                    changed = True
+                    continue
+            fout.write(line)
 
     return changed
 
-def _cleanup_vcpkg_downloads(root_dir):
-    """Scan vcpkg downloads for zero-length or corrupted archives and remove them."""
+def _zip_is_intact(path, size, deep=False):
+    """Return True if the archive (of the given size in bytes) looks sound.
+    The default check only parses the central directory and makes sure every member fits inside
+    the file, which catches truncated downloads; deep=True also CRC-checks every member.
+    """
+    try:
+        with zipfile.ZipFile(path, 'r') as z:
+            if any(info.header_offset + info.compress_size > size for info in z.infolist()):
+                return False
+            return not deep or z.testzip() is None
+    except Exception:
+        return False
+
+def _cleanup_vcpkg_downloads(root_dir, deep=False):
+    """Scan vcpkg downloads for zero-length or corrupted archives and remove them.
+    Pass deep=True to CRC-check every archive (slow; reserve it for when vcpkg already failed).
+    """
     removed = []
     vcpkg_dl = os.path.join(root_dir, 'vcpkg', 'downloads')
-    if not os.path.isdir(vcpkg_dl):
+
+    # Single directory pass: DirEntry caches the type/stat info, so no extra isfile/getsize calls
+    zips = []
+    try:
+        with os.scandir(vcpkg_dl) as it:
+            for entry in it:
+                try:
+                    if not entry.is_file():
+                        continue
+                    # Zero-length files are obviously bad
+                    size = entry.stat().st_size
+                    if size == 0:
+                        os.remove(entry.path)
+                        removed.append(entry.path)
+                    elif entry.name.lower().endswith('.zip'):
+                        zips.append((entry.path, size))
+                except Exception:
+                    pass
+    except OSError:
         return removed
 
-    for fname in os.listdir(vcpkg_dl):
-        full = os.path.join(vcpkg_dl, fname)
-        try:
-            if os.path.isfile(full):
-                # Zero-length files are obviously bad
-                if os.path.getsize(full) == 0:
-                    os.remove(full)
-                    removed.append(full)
+    # CRC-checking archives dominates; zlib releases the GIL so the checks run in parallel
+    if zips:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(zips), CPU_COUNT)) as pool:
+            checks = pool.map(lambda z: _zip_is_intact(*z, deep=deep), zips)
+            for (path, _), intact in zip(zips, checks):
+                if intact:
                     continue
-                # Check basic zip integrity for .zip files
-                if full.lower().endswith('.zip'):
-                    try:
-                        with zipfile.ZipFile(full, 'r') as z:
-                            bad = z.testzip()
-                            if bad is not None:
-                                os.remove(full)
-                                removed.append(full)
-                    except Exception:
-                        # If zip open fails, remove it
-                        try:
-                            os.remove(full)
-                            removed.append(full)
-                        except Exception:
-                            pass
-        except Exception:
-            pass
+                try:
+                    os.remove(path)
+                    removed.append(path)
+                except Exception:
+                    pass
     return removed
 
 
+@functools.lru_cache(maxsize=1)
 def initialize_vcpkg(root_dir):
-    """Initialize vcpkg if it doesn't exist, and install dependencies."""
+    """Initialize vcpkg if it doesn't exist, and install dependencies.
+    Cached: build_neutron and build_box share one vcpkg tree, so only the first call does any work.
+    """
     vcpkg_dir = os.path.join(root_dir, 'vcpkg')
 
     # Check if vcpkg exists, if not clone it
@@ -253,7 +375,7 @@ def initialize_vcpkg(root_dir):
             return False
 
     # Bootstrap vcpkg on Windows
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         vcpkg_exe = os.path.join(vcpkg_dir, 'vcpkg.exe')
         if not os.path.exists(vcpkg_exe):
             Colors.print("Bootstrapping vcpkg...", Colors.BLUE)
@@ -292,19 +414,37 @@ def initialize_vcpkg(root_dir):
 
     # Install dependencies using vcpkg
     Colors.print("Installing vcpkg dependencies...", Colors.BLUE)
-    vcpkg_exe = os.path.join(vcpkg_dir, 'vcpkg.exe') if platform.system() == "Windows" else os.path.join(vcpkg_dir, 'vcpkg')
+    vcpkg_exe = os.path.join(vcpkg_dir, 'vcpkg.exe') if IS_WINDOWS else os.path.join(vcpkg_dir, 'vcpkg')
 
     if not os.path.exists(vcpkg_exe):
         Colors.print(f"vcpkg executable not found at {vcpkg_exe}!", Colors.RED)
         return False
 
     # Install dependencies from vcpkg.json
-    if os.path.exists(os.path.join(root_dir, 'vcpkg.json')):
+    manifest = os.path.join(root_dir, 'vcpkg.json')
+    if os.path.exists(manifest):
         try:
-            triplet = 'x64-windows' if platform.system() == "Windows" else ('x64-osx' if platform.system() == "Darwin" else 'x64-linux')
+            triplet = VCPKG_TRIPLET
+            # Skip the install when the manifest and triplet match the last successful one.
+            # The marker lives in vcpkg_installed/ so deleting the installed tree also invalidates it.
+            with open(manifest, 'rb') as f:
+                manifest_hash = hashlib.sha256(f.read() + triplet.encode()).hexdigest()
+            marker = os.path.join(root_dir, 'vcpkg_installed', '.nt-installed')
+            try:
+                with open(marker, 'r') as f:
+                    if f.read().strip() == manifest_hash:
+                        Colors.print("vcpkg dependencies unchanged; skipping install.", Colors.GREEN)
+                        return True
+            except OSError:
+                pass
+
             vcpkg_cmd = [vcpkg_exe, 'install', '--triplet', triplet]
             result = run_command(vcpkg_cmd, fail_exit=False)
-            if not result:
+            if result:
+                os.makedirs(os.path.dirname(marker), exist_ok=True)
+                with open(marker, 'w') as f:
+                    f.write(manifest_hash)
+            else:
                 Colors.print("vcpkg install failed. This might cause build failures later.", Colors.YELLOW)
                 # Continue with warning as some dependencies might already be installed
         except Exception as e:
@@ -321,47 +461,63 @@ def _handle_vcpkg_manifest_log(build_dir, root_dir):
     Returns True if something was deleted and a retry should be attempted.
     """
     log = os.path.join(build_dir, 'vcpkg-manifest-install.log')
-    if not os.path.exists(log):
-        return False
+    # Map the log instead of reading and decoding it; the patterns search the mapped bytes directly.
+    # One pass over the log collects archive paths and which failure kinds appeared
+    archives = []
+    seen = set()
     try:
-        content = open(log, 'r', encoding='utf-8', errors='ignore').read()
-    except Exception:
+        with open(log, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    for m in VCPKG_LOG_RE.finditer(content):
+                        if m.lastgroup == 'archive':
+                            archives.append(m.group('path'))
+                        else:
+                            seen.add(m.lastgroup)
+            except ValueError:
+                # An empty log cannot be mapped. vcpkg leaves one when it dies early, which is
+                # when the cleanup and manual extraction below matter most, so carry on without findings
+                pass
+    except OSError:
+        # No log (or unreadable): nothing to act on
         return False
+    sevenzip_failed = 'sevenzip' in seen
+    pwsh_failed = 'pwsh' in seen or {'pwsh_core', 'failed'} <= seen
 
-    # Look for lines that indicate a bad archive, e.g. "ERROR: C:\...\PowerShell-7.5.4-win-x64.zip"
-    matches = re.findall(r'ERROR:\s*(.+\.(zip|tar|tgz|gz|xz|7z))', content, flags=re.IGNORECASE)
     removed_any = False
-    for m in matches:
-        path = m[0].strip()
+    for archive in archives:
+        path = archive.decode('utf-8', errors='ignore').strip()
         # Normalize and remove if exists
         if os.path.isabs(path):
             target = path
         else:
             target = os.path.join(root_dir, path)
         try:
-            if os.path.exists(target):
-                Colors.print(f"Removing corrupt vcpkg download: {target}", Colors.YELLOW)
-                os.remove(target)
-                removed_any = True
+            os.remove(target)
+            Colors.print(f"Removed corrupt vcpkg download: {target}", Colors.YELLOW)
+            removed_any = True
         except Exception:
             pass
 
     # Detect 7zip/tool extraction failures (Codec Load Error, 7zip failed)
-    if '7zip' in content.lower() or 'codec load error' in content.lower() or '7z.dll' in content.lower():
+    if sevenzip_failed:
         tools_dir = os.path.join(root_dir, 'vcpkg', 'downloads', 'tools')
-        if os.path.isdir(tools_dir):
-            for entry in os.listdir(tools_dir):
-                if '7zip' in entry.lower() or '7-zip' in entry.lower() or entry.lower().startswith('7zip'):
-                    path = os.path.join(tools_dir, entry)
-                    try:
-                        shutil.rmtree(path)
-                        Colors.print(f"Removed vcpkg tool folder due to extraction error: {path}", Colors.YELLOW)
-                        removed_any = True
-                    except Exception:
-                        pass
+        try:
+            with os.scandir(tools_dir) as it:
+                tool_dirs = [entry.path for entry in it
+                             if '7zip' in entry.name.lower() or '7-zip' in entry.name.lower()]
+        except OSError:
+            tool_dirs = []
+        for path in tool_dirs:
+            try:
+                shutil.rmtree(path)
+                Colors.print(f"Removed vcpkg tool folder due to extraction error: {path}", Colors.YELLOW)
+                removed_any = True
+            except Exception:
+                pass
 
     # If PowerShell extraction or runtime validation failed repeatedly, surface an actionable message
-    if 'pwsh.exe failed' in content.lower() or 'pwsh.dll' in content.lower() or 'powershell-core' in content.lower() and 'failed' in content.lower():
+    if pwsh_failed:
         Colors.print("vcpkg failed to install PowerShell runtime. This commonly happens when the extracted PowerShell lacks required runtime files or system dependencies.", Colors.RED)
         Colors.print("Actions you can take:", Colors.YELLOW)
         Colors.print("  1) Install PowerShell 7.5.4 for Windows from https://github.com/PowerShell/PowerShell/releases and ensure 'pwsh.exe' runs on your system.", Colors.YELLOW)
@@ -371,8 +527,9 @@ def _handle_vcpkg_manifest_log(build_dir, root_dir):
         # Returning False indicates we didn't auto-fix the issue
         return False
 
-    # Additionally, run a general cleanup pass to remove any obvious bad zips
-    removed = _cleanup_vcpkg_downloads(root_dir)
+    # Additionally, run a general cleanup pass to remove any bad zips; configure already failed,
+    # so pay for the full CRC check here
+    removed = _cleanup_vcpkg_downloads(root_dir, deep=True)
     if removed:
         removed_any = True
 
@@ -380,24 +537,25 @@ def _handle_vcpkg_manifest_log(build_dir, root_dir):
     # Look for PowerShell downloads in the downloads directory
     try:
         dl_dir = os.path.join(root_dir, 'vcpkg', 'downloads')
-        if os.path.isdir(dl_dir):
-            for fname in os.listdir(dl_dir):
-                if 'powershell' in fname.lower() and fname.lower().endswith('.zip'):
-                    full = os.path.join(dl_dir, fname)
-                    # Attempt manual extraction into expected tools folder
-                    tool_name = None
-                    # try to infer version folder name used by vcpkg when extracting
-                    # e.g., tools\powershell-core-7.5.4-windows
-                    m = re.search(r'(powershell[-_].*?\d[\d\.\-]*[-_]?win)', fname, flags=re.IGNORECASE)
-                    if m:
-                        tool_name = m.group(0)
-                    else:
-                        # Fallback name
-                        tool_name = 'powershell-core-7.5.4-windows'
-                    target_dir = os.path.join(root_dir, 'vcpkg', 'downloads', 'tools', tool_name)
-                    if _manual_extract_zip(full, target_dir):
-                        Colors.print(f"Manual extraction of {full} succeeded -> {target_dir}", Colors.GREEN)
-                        removed_any = True
+        with os.scandir(dl_dir) as it:
+            fnames = [entry.name for entry in it]
+        for fname in fnames:
+            if 'powershell' in fname.lower() and fname.lower().endswith('.zip'):
+                full = os.path.join(dl_dir, fname)
+                # Attempt manual extraction into expected tools folder
+                tool_name = None
+                # try to infer version folder name used by vcpkg when extracting
+                # e.g., tools\powershell-core-7.5.4-windows
+                m = POWERSHELL_TOOL_RE.search(fname)
+                if m:
+                    tool_name = m.group(0)
+                else:
+                    # Fallback name
+                    tool_name = 'powershell-core-7.5.4-windows'
+                target_dir = os.path.join(root_dir, 'vcpkg', 'downloads', 'tools', tool_name)
+                if _manual_extract_zip(full, target_dir):
+                    Colors.print(f"Manual extraction of {full} succeeded -> {target_dir}", Colors.GREEN)
+                    removed_any = True
     except Exception:
         pass
 
@@ -416,10 +574,9 @@ def _manual_extract_zip(zip_path, target_dir):
             except Exception:
                 pass
         os.makedirs(temp_dir, exist_ok=True)
+        # extractall verifies each member's CRC as it goes and raises BadZipFile on corruption,
+        # so there is no need for a separate testzip() pass over the whole archive first
         with zipfile.ZipFile(zip_path, 'r') as z:
-            bad = z.testzip()
-            if bad:
-                Colors.print(f"Zip test failed: first bad file {bad}", Colors.YELLOW)
             z.extractall(temp_dir)
         # Move extracted files into target_dir
         if os.path.exists(target_dir):
@@ -444,6 +601,20 @@ def _manual_extract_zip(zip_path, target_dir):
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def find_host_tool(name, *fallback_paths):
+    """Locate a host tool on PATH (PATHEXT-aware on Windows), then at the given fallback paths.
+    Returns the path or None. Cached, so repeated preflight/retry passes don't rescan PATH.
+    """
+    found = shutil.which(name)
+    if found:
+        return found
+    for path in fallback_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
 def preflight_check_windows():
     """Check common host prerequisites that frequently break vcpkg on Windows.
     Returns True if the essentials are present and executable (pwsh); otherwise False.
@@ -452,33 +623,31 @@ def preflight_check_windows():
     ok = True
 
     # Check for pwsh (PowerShell 7)
-    pwsh = shutil.which('pwsh') or shutil.which('pwsh.exe')
+    pwsh = find_host_tool('pwsh')
     if not pwsh:
         Colors.print("PowerShell 7 (pwsh) not found in PATH. vcpkg downloads PowerShell and executes it; missing pwsh can lead to failures.", Colors.RED)
         Colors.print("Install PowerShell 7.5.4 from https://github.com/PowerShell/PowerShell/releases and ensure 'pwsh.exe' runs on your system.", Colors.YELLOW)
         ok = False
     else:
         try:
-            out = subprocess.check_output([pwsh, '--version'], stderr=subprocess.STDOUT, universal_newlines=True)
-            Colors.print(f"Detected pwsh: {out.strip()}", Colors.GREEN)
+            out = subprocess.run([pwsh, '--version'], stdout=subprocess.PIPE,
+                                 stderr=subprocess.STDOUT, creationflags=NO_WINDOW, timeout=10, check=True).stdout
+            Colors.print(f"Detected pwsh: {out.decode(errors='replace').strip()}", Colors.GREEN)
         except Exception as e:
             Colors.print(f"pwsh exists but failed to execute: {e}", Colors.RED)
             ok = False
 
     # Check for 7-Zip (7z) presence (used by vcpkg for extraction)
-    seven = shutil.which('7z') or shutil.which('7z.exe')
-    if not seven:
-        pf = os.environ.get('ProgramFiles', r"C:\Program Files")
-        common = os.path.join(pf, '7-Zip', '7z.exe')
-        if os.path.exists(common):
-            seven = common
+    pf = os.environ.get('ProgramFiles', r"C:\Program Files")
+    seven = find_host_tool('7z', os.path.join(pf, '7-Zip', '7z.exe'))
 
     if not seven:
         Colors.print("7-Zip not found (7z). This can cause vcpkg archive extraction failures.", Colors.YELLOW)
         Colors.print("Install 7-Zip or ensure '7z' is available in PATH.", Colors.YELLOW)
     else:
         try:
-            subprocess.check_output([seven, '--help'], stderr=subprocess.STDOUT, universal_newlines=True)
+            subprocess.run([seven, '--help'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           creationflags=NO_WINDOW, timeout=10, check=True)
             Colors.print("7z found", Colors.GREEN)
         except Exception:
             Colors.print("7z exists but failed to run; extraction may fail.", Colors.YELLOW)
@@ -498,22 +667,136 @@ def preflight_check_windows():
     return ok
 
 
-def build_neutron(os_type, arch_type, build_dir="build", skip_vcpkg=False, debug=False, static_lsp=False):
+def build_job_count(builds=1):
+    """Parallel compile jobs for each of `builds` concurrent builds: a total budget of
+    CMAKE_BUILD_PARALLEL_LEVEL if set, otherwise 90% of the usable cores (leaving headroom for
+    the linker and the desktop), shared between the builds. Always at least 1.
+    """
+    level = os.environ.get("CMAKE_BUILD_PARALLEL_LEVEL", "")
+    if level.isdigit() and int(level) > 0:
+        return max(1, int(level) // builds)
+    return max(1, int(CPU_COUNT * 0.9) // builds)
+
+def cmake_generator_args(build_dir):
+    """["-G", "Ninja"] when ninja is installed, unless build_dir is already configured with another
+    generator (CMake refuses to switch generators in place; --fresh clears the cache first).
+    A build_dir configured for Ninja while ninja is no longer installed can't be built or
+    reconfigured as is, so its cache is dropped and the default generator used instead.
+    """
+    cached = None
+    try:
+        with open(os.path.join(build_dir, 'CMakeCache.txt'), 'r', errors='replace') as f:
+            for line in f:
+                if line.startswith('CMAKE_GENERATOR:'):
+                    cached = line.partition('=')[2].strip()
+                    break
+    except OSError:
+        pass
+    if not NINJA:
+        if cached == "Ninja":
+            Colors.print(f"{build_dir} was configured for Ninja, which is no longer installed; "
+                         "reconfiguring from scratch with the default generator.", Colors.YELLOW)
+            drop_cmake_cache(build_dir)
+            shutil.rmtree(os.path.join(build_dir, 'CMakeFiles'), ignore_errors=True)
+        return []
+    if cached and cached != "Ninja":
+        return []
+    return ["-G", "Ninja"]
+
+def compiler_launcher_args():
+    """CMake flags that route C/C++ compiles through COMPILER_LAUNCHER. Without one, the flags unset
+    the variables instead: CMake caches them, so a launcher that has since been uninstalled would
+    otherwise stay in CMakeCache.txt and break the build. Only the Makefile and Ninja generators
+    honour them, i.e. the Unix builds here.
+    """
+    if not COMPILER_LAUNCHER:
+        return ["-UCMAKE_C_COMPILER_LAUNCHER", "-UCMAKE_CXX_COMPILER_LAUNCHER"]
+    return [f"-DCMAKE_C_COMPILER_LAUNCHER={COMPILER_LAUNCHER}", f"-DCMAKE_CXX_COMPILER_LAUNCHER={COMPILER_LAUNCHER}"]
+
+def cmake_cache_valid(build_dir, source_dir, cmake_cmd):
+    """True if build_dir was last configured with cmake_cmd and its CMakeCache.txt is newer than
+    every CMake input (CMakeLists.txt, *.cmake, presets, vcpkg.json) under source_dir, so the
+    configure step can be skipped. The command is recorded by mark_cmake_configured.
+    """
+    try:
+        cache_mtime = os.stat(os.path.join(build_dir, 'CMakeCache.txt')).st_mtime_ns
+        with open(os.path.join(build_dir, '.nt-configured'), 'r') as f:
+            if f.read() != "\n".join(cmake_cmd):
+                return False
+        for path in iter_artifacts(source_dir, CMAKE_INPUT_EXCLUDE_DIRS, CMAKE_INPUT_RE):
+            if os.stat(path).st_mtime_ns > cache_mtime:
+                return False
+    except OSError:
+        return False
+    return True
+
+def mark_cmake_configured(build_dir, cmake_cmd):
+    """Record the command build_dir was successfully configured with (see cmake_cache_valid)."""
+    with open(os.path.join(build_dir, '.nt-configured'), 'w') as f:
+        f.write("\n".join(cmake_cmd))
+
+def drop_cmake_cache(build_dir):
+    """Forget build_dir's configure state (like cmake --fresh) so the next configure starts over."""
+    for name in ('CMakeCache.txt', '.nt-configured', '.nt-built'):
+        safe_remove(os.path.join(build_dir, name))
+
+def _build_stamp(build_config):
+    """Contents of a .nt-built stamp: the configuration plus the configure inputs that do not show
+    up as file mtimes (the Ninja and compiler launcher found on this machine)."""
+    return "\n".join((build_config, NINJA or "", COMPILER_LAUNCHER or ""))
+
+def mark_built(build_dir, build_config, started):
+    """Record that build_dir built build_config successfully; the stamp is dated to when the
+    build started (a time.time() value), so sources edited during the build still count as newer.
+    """
+    stamp = os.path.join(build_dir, '.nt-built')
+    with open(stamp, 'w') as f:
+        f.write(_build_stamp(build_config))
+    os.utime(stamp, (started, started))
+
+def build_up_to_date(build_dir, build_config, source_dir, exes):
+    """True if build_dir last built build_config successfully with the same tools (see
+    mark_built), every executable in exes is still there, and no source or CMake input under
+    source_dir has changed since that build started.
+    """
+    stamp = os.path.join(build_dir, '.nt-built')
+    try:
+        built_at = os.stat(stamp).st_mtime_ns
+        with open(stamp, 'r') as f:
+            if f.read() != _build_stamp(build_config):
+                return False
+        if not all(find_binary(build_dir, exe, build_config) for exe in exes):
+            return False
+        for path in iter_artifacts(source_dir, CMAKE_INPUT_EXCLUDE_DIRS, BUILD_INPUT_RE):
+            if os.stat(path).st_mtime_ns > built_at:
+                return False
+    except OSError:
+        return False
+    return True
+
+def build_neutron(os_type, arch_type, build_dir="build", skip_vcpkg=False, debug=False, static_lsp=False, root_dir=None, fresh=False, jobs=None):
     """Configure and build Neutron. If vcpkg fails due to third-party tool issues
     (e.g. PowerShell extraction toolchain), we will warn and continue so that
     other parts (like Box) can still be built and the packaging flow can proceed.
+    Relative paths resolve against root_dir (default: the current directory); the process
+    working directory is never changed, so builds can run concurrently.
+    Configure is skipped when the existing CMake cache is still valid, unless fresh is set.
+    jobs caps the parallel compile jobs (default: build_job_count()).
     Returns True if we can continue; False only if a non-recoverable error occurs.
     """
     global VCPKG_ISSUE_DETECTED
     VCPKG_ISSUE_DETECTED = False
 
     Colors.print("Configuring and building Neutron...", Colors.BLUE)
+    root_dir = root_dir or os.getcwd()
+    build_dir = os.path.join(root_dir, build_dir)
     os.makedirs(build_dir, exist_ok=True)
+    if fresh:
+        drop_cmake_cache(build_dir)
 
     cmake_exe = get_cmake_command()
 
     # Initialize vcpkg first if needed
-    root_dir = os.getcwd()
     if os_type == "windows" and not skip_vcpkg:
         initialize_vcpkg(root_dir)
 
@@ -521,48 +804,51 @@ def build_neutron(os_type, arch_type, build_dir="build", skip_vcpkg=False, debug
     if os_type == "windows":
         # Use vcpkg preset
         cmake_cmd = [cmake_exe, "--preset", "winmsvc"]
-        run_cwd = os.getcwd()  # Run from root for presets
+        run_cwd = root_dir  # Run from root for presets
     else:
         build_type = "Debug" if debug else "Release"
-        cmake_cmd = [cmake_exe, "..", f"-DCMAKE_BUILD_TYPE={build_type}"]
+        cmake_cmd = [cmake_exe, "..", f"-DCMAKE_BUILD_TYPE={build_type}"] + cmake_generator_args(build_dir) + compiler_launcher_args()
         if static_lsp and os_type == "linux":
             cmake_cmd.append("-DCMAKE_EXE_LINKER_FLAGS=-static-libgcc -static-libstdc++")
         run_cwd = build_dir
-        os.chdir(build_dir)  # Change to build directory for Unix systems
 
     # On Windows with vcpkg, retry configure up to N times if vcpkg download/extract fails
     max_attempts = 3
     attempt = 0
 
-    while attempt < max_attempts:
-        attempt += 1
-        # Pre-clean any obviously-bad downloads before configuring
-        _cleanup_vcpkg_downloads(os.getcwd())
-
-        Colors.print(f"CMake configure attempt {attempt}/{max_attempts}...", Colors.BLUE)
-        success = run_command(cmake_cmd, cwd=run_cwd, fail_exit=False)
-        if success:
-            # Configure succeeded, proceed to build
-            break
-
-        # Configure failed; check vcpkg log for archive issues
-        Colors.print("CMake configure failed; checking vcpkg logs for corrupt downloads...", Colors.YELLOW)
-        handled = _handle_vcpkg_manifest_log(build_dir, os.getcwd())
-        if handled:
-            # If we fixed something, retry
-            Colors.print("Deleted suspected corrupt vcpkg downloads/tools; retrying configure...", Colors.YELLOW)
-            time.sleep(1)
-            continue
+    # Configure steps share the vcpkg tree (downloads, tools) and the terminal, and the cleanup
+    # below deletes partial downloads, so they run one at a time; only compiling overlaps
+    with CONFIGURE_LOCK:
+        cache_valid = not fresh and cmake_cache_valid(build_dir, root_dir, cmake_cmd)
+        if cache_valid:
+            Colors.print("CMake cache is up to date; skipping configure.", Colors.GREEN)
+
+        while not cache_valid and attempt < max_attempts:
+            attempt += 1
+            # Pre-clean any obviously-bad downloads before configuring
+            _cleanup_vcpkg_downloads(root_dir)
+
+            Colors.print(f"CMake configure attempt {attempt}/{max_attempts}...", Colors.BLUE)
+            success = run_command(cmake_cmd, cwd=run_cwd, fail_exit=False)
+            if success:
+                # Configure succeeded, proceed to build
+                mark_cmake_configured(build_dir, cmake_cmd)
+                break
 
-        # If we couldn't handle the log (e.g. pwsh runtime missing), set flag and proceed with a warning
-        Colors.print("vcpkg reported issues that couldn't be auto-fixed. Continuing without full vcpkg install.", Colors.YELLOW)
-        VCPKG_ISSUE_DETECTED = True
-        # Break out and allow overall packaging to continue; some artifacts may be missing
-        break
+            # Configure failed; check vcpkg log for archive issues
+            Colors.print("CMake configure failed; checking vcpkg logs for corrupt downloads...", Colors.YELLOW)
+            handled = _handle_vcpkg_manifest_log(build_dir, root_dir)
+            if handled:
+                # If we fixed something, retry
+                Colors.print("Deleted suspected corrupt vcpkg downloads/tools; retrying configure...", Colors.YELLOW)
+                time.sleep(1)
+                continue
 
-    # Change back to original directory if needed
-    if os_type != "windows":
-        os.chdir(root_dir)
+            # If we couldn't handle the log (e.g. pwsh runtime missing), set flag and proceed with a warning
+            Colors.print("vcpkg reported issues that couldn't be auto-fixed. Continuing without full vcpkg install.", Colors.YELLOW)
+            VCPKG_ISSUE_DETECTED = True
+            # Break out and allow overall packaging to continue; some artifacts may be missing
+            break
 
     # Check if configure produced build files; if not and we didn't detect a vcpkg issue, it's fatal
     if not os.path.exists(os.path.join(build_dir, 'CMakeCache.txt')) and not VCPKG_ISSUE_DETECTED:
@@ -572,40 +858,40 @@ def build_neutron(os_type, arch_type, build_dir="build", skip_vcpkg=False, debug
     # Attempt to build if configure generated files
     if os.path.exists(build_dir):
         build_config = "Debug" if debug else "Release"
-        build_cmd = [cmake_exe, "--build", ".", "--config", build_config]
-        # Parallel build
-        import multiprocessing
-        try:
-            cpu_count = multiprocessing.cpu_count()
-            build_cmd.append(f"-j{cpu_count}")
-        except:
-            pass
+        # --parallel is generator-neutral: CMake maps it to -j for Make/Ninja and /m for MSBuild
+        build_cmd = [cmake_exe, "--build", ".", "--config", build_config, "--parallel", str(jobs or build_job_count())]
 
+        started = time.time()
         if not run_command(build_cmd, cwd=build_dir, fail_exit=False):
             Colors.print("Build failed for Neutron; proceeding with packaging but some runtime files may be missing.", Colors.YELLOW)
             VCPKG_ISSUE_DETECTED = True
             # Not fatal; return True to continue overall packaging
             return True
+        if not VCPKG_ISSUE_DETECTED:
+            mark_built(build_dir, build_config, started)
     else:
         Colors.print("Build directory not found after configure; continuing packaging as best-effort.", Colors.YELLOW)
         VCPKG_ISSUE_DETECTED = True
 
     return True
 
-def build_box(os_type, arch_type, build_dir="nt-box/build", skip_vcpkg=False, debug=False):
+def build_box(os_type, arch_type, build_dir="nt-box/build", skip_vcpkg=False, debug=False, root_dir=None, fresh=False, jobs=None):
     Colors.print("Configuring and building Box package manager...", Colors.BLUE)
+    root_dir = root_dir or os.getcwd()
+    build_dir = os.path.join(root_dir, build_dir)
 
     # Initialize vcpkg first if needed
-    root_dir = os.getcwd()
     if os_type == "windows" and not skip_vcpkg:
         initialize_vcpkg(root_dir)
 
     # Ensure the nt-box directory exists
-    if not os.path.exists("nt-box"):
+    if not os.path.exists(os.path.join(root_dir, "nt-box")):
         Colors.print("nt-box directory not found! Cannot build Box package manager.", Colors.RED)
         return False
 
     os.makedirs(build_dir, exist_ok=True)
+    if fresh:
+        drop_cmake_cache(build_dir)
 
     cmake_exe = get_cmake_command()
 
@@ -618,34 +904,92 @@ def build_box(os_type, arch_type, build_dir="nt-box/build", skip_vcpkg=False, de
         run_cwd = build_dir
     else:
         build_type = "Debug" if debug else "Release"
-        cmake_cmd = [cmake_exe, "..", f"-DCMAKE_BUILD_TYPE={build_type}"]
+        cmake_cmd = [cmake_exe, "..", f"-DCMAKE_BUILD_TYPE={build_type}"] + cmake_generator_args(build_dir) + compiler_launcher_args()
         run_cwd = build_dir
 
-    # Configure
-    if not run_command(cmake_cmd, cwd=run_cwd, fail_exit=False):
-        Colors.print("CMake configure failed for Box.", Colors.RED)
-        return False
+    # Configure (unless the existing cache is still valid), never alongside Neutron's configure
+    with CONFIGURE_LOCK:
+        if not fresh and cmake_cache_valid(build_dir, os.path.join(root_dir, "nt-box"), cmake_cmd):
+            Colors.print("Box CMake cache is up to date; skipping configure.", Colors.GREEN)
+        elif run_command(cmake_cmd, cwd=run_cwd, fail_exit=False):
+            mark_cmake_configured(build_dir, cmake_cmd)
+        else:
+            Colors.print("CMake configure failed for Box.", Colors.RED)
+            return False
 
     # Build
     build_config = "Debug" if debug else "Release"
-    build_cmd = [cmake_exe, "--build", ".", "--config", build_config]
-    import multiprocessing
-    try:
-        cpu_count = multiprocessing.cpu_count()
-        build_cmd.append(f"-j{cpu_count}")
-    except:
-        pass
+    build_cmd = [cmake_exe, "--build", ".", "--config", build_config, "--parallel", str(jobs or build_job_count())]
 
+    started = time.time()
     if not run_command(build_cmd, cwd=build_dir, fail_exit=False):
         Colors.print("Build failed for Box; proceeding with packaging but box.exe may be missing.", Colors.YELLOW)
         return False
+    mark_built(build_dir, build_config, started)
 
     return True
 
+def _win_rmtree(path):
+    """Delete a directory tree with the shell's SHFileOperationW, without spawning cmd.exe.
+    Returns True on success. Only meaningful on Windows.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class SHFILEOPSTRUCTW(ctypes.Structure):
+        _fields_ = [
+            ("hwnd", wintypes.HWND),
+            ("wFunc", wintypes.UINT),
+            ("pFrom", wintypes.LPCWSTR),
+            ("pTo", wintypes.LPCWSTR),
+            ("fFlags", wintypes.WORD),
+            ("fAnyOperationsAborted", wintypes.BOOL),
+            ("hNameMappings", wintypes.LPVOID),
+            ("lpszProgressTitle", wintypes.LPCWSTR),
+        ]
+
+    FO_DELETE = 0x0003
+    FOF_SILENT = 0x0004
+    FOF_NOCONFIRMATION = 0x0010
+    FOF_NOERRORUI = 0x0400
+
+    # pFrom is a double-NUL-terminated list and must hold absolute paths
+    op = SHFILEOPSTRUCTW(wFunc=FO_DELETE, pFrom=os.path.abspath(path) + '\0',
+                         fFlags=FOF_SILENT | FOF_NOCONFIRMATION | FOF_NOERRORUI)
+    return ctypes.windll.shell32.SHFileOperationW(ctypes.byref(op)) == 0 and not op.fAnyOperationsAborted
+
+def iter_artifacts(root, exclude_dirs, artifact_re, exclude_paths=()):
+    """Yield paths of files under root whose name artifact_re finds a match in.
+    Directories named in exclude_dirs (at any depth) or whose root-relative path, written with
+    '/', is in exclude_paths are pruned before they are listed; symlinked directories are not followed.
+    Uses an explicit os.scandir stack so the file/dir type comes from the directory listing
+    itself, and tests each name with a single regex search.
+    """
+    exclude_paths = set(exclude_paths)
+    stack = [(root, '')]
+    while stack:
+        path, rel = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    entry_rel = rel + entry.name
+                    if (entry.name not in exclude_dirs and entry_rel not in exclude_paths
+                            and not entry.is_symlink()):
+                        stack.append((entry.path, entry_rel + '/'))
+                elif artifact_re.search(entry.name):
+                    yield entry.path
+
 def clean_project():
     """Clean up build artifacts and temporary files."""
     import stat
-    import glob
     import fnmatch
     
     Colors.print("Cleaning up project...", Colors.BLUE)
@@ -662,32 +1006,33 @@ def clean_project():
                 shutil.rmtree(path, onerror=on_rm_error)
             except Exception as e:
                 Colors.print(f"Python remove failed: {e}", Colors.RED)
-                # Try shell
-                if os.name == 'nt':
-                    os.system(f"rmdir /s /q {path}")
+                # Fall back to the OS: the shell API on Windows, rm elsewhere
+                if IS_WINDOWS:
+                    if not _win_rmtree(path):
+                        Colors.print(f"Shell remove failed: {path}", Colors.RED)
                 else:
-                    os.system(f"rm -rf {path}")
-
-    # Remove build directories
-    force_remove_dir("build")
-    force_remove_dir("nt-box/build")
+                    subprocess.run(["rm", "-rf", "--", path])
 
     # Try to remove files robustly (handles locked files on Windows)
-    def remove_with_retries(path, retries=10, delay=0.5):
-        for i in range(retries):
+    def remove_with_retries(path, timeout=5.0, verbose=True):
+        attempts = 0
+        for delay in backoff_delays(timeout):
+            time.sleep(delay)
+            attempts += 1
             try:
-                if os.path.exists(path):
+                os.chmod(path, stat.S_IWRITE)
+                if verbose:
                     Colors.print(f"Removing file: {path}", Colors.YELLOW)
-                    os.chmod(path, stat.S_IWRITE)
-                    os.remove(path)
+                os.remove(path)
+                return True
+            except FileNotFoundError:
                 return True
             except PermissionError:
-                Colors.print(f"PermissionError removing {path}; retrying ({i+1}/{retries})...", Colors.YELLOW)
-                time.sleep(delay)
+                Colors.print(f"PermissionError removing {path}; retrying (attempt {attempts})...", Colors.YELLOW)
             except Exception as e:
                 Colors.print(f"Error removing {path}: {e}", Colors.RED)
                 return False
-        Colors.print(f"Failed to remove {path} after {retries} attempts.", Colors.RED)
+        Colors.print(f"Failed to remove {path} after {attempts} attempts.", Colors.RED)
         return False
 
     # Remove top-level binaries and libs
@@ -697,53 +1042,157 @@ def clean_project():
     else:
         patterns = ["neutron", "box", "libneutron_runtime.*", "*.a", "*.so", "*.dylib"]
 
-    for pat in patterns:
-        for f in glob.glob(pat):
-            remove_with_retries(f)
+    # Also any copied lib/dll in project root (leftovers from packaging)
+    patterns += ["*.lib", "*.dll", "*.a", "*.so", "*.dylib", "*.exe"]
+    # One directory listing matched against all patterns at once, instead of a glob per pattern
+    top_level_re = re.compile('|'.join(fnmatch.translate(pat) for pat in dict.fromkeys(patterns)),
+                              flags=re.IGNORECASE if IS_WINDOWS else 0)
+    with os.scandir('.') as it:
+        top_level_files = {entry.name for entry in it
+                           if not entry.name.startswith('.') and top_level_re.match(entry.name) and entry.is_file()}
+
+    # Build directories and top-level files are independent: remove them concurrently so
+    # slow deletes and lock retries overlap instead of adding up
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, CPU_COUNT * 4)) as pool:
+        futures = [pool.submit(force_remove_dir, d) for d in ("build", "nt-box/build")]
+        futures += [pool.submit(remove_with_retries, f) for f in sorted(top_level_files)]
+        concurrent.futures.wait(futures)
+
+    # Remove build artifacts recursively but avoid touching third-party folders: VCS metadata and
+    # package caches wherever they appear, the rest only at their known locations in the project root
+    exclude_dirs = {'.git', 'node_modules', '.box'}
+    exclude_paths = {'vcpkg', 'vcpkg_installed', 'neutron-linux-x64', 'neutron-windows-x64', 'build_test', 'vscode-extension'}
 
-    # Remove any copied lib/dll in project root (leftovers from packaging)
-    for f in glob.glob("*.lib") + glob.glob("*.dll") + glob.glob("*.a") + glob.glob("*.so") + glob.glob("*.dylib") + glob.glob("*.exe"):
-        remove_with_retries(f)
+    Colors.print("Scanning project tree for build artifacts (excluding common third-party dirs)...", Colors.BLUE)
+    artifacts = list(iter_artifacts('.', exclude_dirs, ARTIFACT_RE, exclude_paths))
+    # Unlinks are latency-bound (especially on NTFS), so overlap them; failures are still reported
+    # individually, successes only as a total
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, CPU_COUNT * 4)) as pool:
+        removed = sum(pool.map(functools.partial(remove_with_retries, verbose=False), artifacts))
+    if artifacts:
+        Colors.print(f"Removed {removed} of {len(artifacts)} build artifacts from the project tree.", Colors.YELLOW)
 
-    # Remove build artifacts recursively but avoid touching third-party folders
-    exclude_dirs = {'.git', 'vcpkg', 'neutron-linux-x64', 'neutron-windows-x64', 'build_test', 'node_modules', '.box', 'vscode-extension'}
-    # Patterns to remove (add .obj and .exe as requested)
-    patterns = ['*.dll', '*.lib', '*.a', '*.so', '*.dylib', '*.obj', '*.exe', '*.pdb', '*.ilk', '*.exp']
+    Colors.print("Clean complete.", Colors.GREEN)
 
-    Colors.print("Scanning project tree for build artifacts (excluding common third-party dirs)...", Colors.BLUE)
-    for root, dirs, files in os.walk('.'):
-        # Normalize and skip excluded folders
-        # Modify dirs in-place to prevent os.walk from recursing into them
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
+@functools.lru_cache(maxsize=1)
+def _windows_executable_index():
+    """Collect the lowercased executable names on PATH (with and without PATHEXT suffix).
+    One scandir per PATH entry replaces shutil.which's stat per directory x extension.
+    """
+    pathext = tuple(ext.lower() for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if ext)
+    names = set()
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if name.endswith(pathext) and entry.is_file():
+                        names.add(name)
+                        names.add(os.path.splitext(name)[0])
+        except OSError:
+            pass
+    return frozenset(names)
+
+# Dependency probes are cached: each PATH walk / pkg-config spawn happens once per run
+@functools.lru_cache(maxsize=None)
+def command_exists(cmd):
+    if IS_WINDOWS:
+        return cmd.lower() in _windows_executable_index()
+    return shutil.which(cmd) is not None
+
+# Accepts several packages so they can be checked with a single pkg-config spawn;
+# pkg-config --exists only succeeds if all of them are present
+@functools.lru_cache(maxsize=None)
+def check_pkg_config(*pkg_names):
+    if not pkg_names or not PKG_CONFIG:
+        return False
+    result = subprocess.run([PKG_CONFIG, "--exists", *pkg_names], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+# Homebrew install locations probed for jsoncpp on macOS (Apple Silicon first)
+JSONCPP_DYLIB_PATHS = (
+    "/opt/homebrew/lib/libjsoncpp.dylib",
+    "/usr/local/lib/libjsoncpp.dylib",
+)
+
+# os-release ID -> (install command, jsoncpp development package)
+LINUX_DISTRO_PACKAGES = {
+    "ubuntu": ("sudo apt-get install -y", "libjsoncpp-dev"),
+    "debian": ("sudo apt-get install -y", "libjsoncpp-dev"),
+    "arch": ("sudo pacman -S --noconfirm", "jsoncpp"),
+    "fedora": ("sudo dnf install -y", "jsoncpp-devel"),
+}
+
+# Parse /etc/os-release into a dict (ID, ID_LIKE, ...) once per run.
+# Values follow shell quoting rules (quotes, backslash escapes), so unquote them with shlex.
+@functools.lru_cache(maxsize=1)
+def read_os_release():
+    info = {}
+    try:
+        with open("/etc/os-release") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                try:
+                    words = shlex.split(value)
+                except ValueError:
+                    # Malformed quoting: keep the raw value rather than dropping the key
+                    words = [value.strip('"').strip("'")]
+                info[key.strip()] = " ".join(words)
+    except OSError:
+        # Missing (non-Linux, minimal containers) or unreadable: no distro info
+        pass
+    return info
 
-        for pat in patterns:
-            for filename in fnmatch.filter(files, pat):
-                path = os.path.join(root, filename)
-                remove_with_retries(path)
+# A passing dependency check is remembered on disk for a day, keyed by what decides its outcome
+# (platform, PATH, distro), so repeated runs on an unchanged machine skip the probes.
+# Only "all present" is cached: a run that finds missing dependencies always re-probes.
+DEPCHECK_CACHE_TTL = 24 * 60 * 60
 
-    Colors.print("Clean complete.", Colors.GREEN)
+def _depcheck_cache_path():
+    base = os.environ.get("LOCALAPPDATA") if IS_WINDOWS else os.environ.get("XDG_CACHE_HOME")
+    return os.path.join(base or os.path.join(os.path.expanduser("~"), ".cache"), "neutron", "depcheck.json")
 
-def check_dependencies():
-    """Check for development dependencies and suggest installation commands."""
-    import shutil
-    import subprocess
-    
+def _depcheck_cache_key():
+    parts = (platform.platform(), os.environ.get("PATH", ""), repr(sorted(read_os_release().items())))
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+def check_dependencies(use_cache=True):
+    """Check for development dependencies and suggest installation commands.
+    With use_cache, a recent passing result for the same platform/PATH/distro is reused.
+    """
     Colors.print("Checking for required dependencies...", Colors.BLUE)
-    
-    def command_exists(cmd):
-        return shutil.which(cmd) is not None
 
-    def check_pkg_config(pkg_name):
-        if not command_exists("pkg-config"):
-            return False
+    cache_path = _depcheck_cache_path()
+    cache_key = _depcheck_cache_key()
+    if use_cache:
         try:
-            subprocess.check_call(["pkg-config", "--exists", pkg_name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached.get("key") == cache_key and time.time() - cached.get("time", 0) < DEPCHECK_CACHE_TTL:
+                Colors.print("All dependencies seem to be present (cached; use --refresh-deps to re-check).", Colors.GREEN)
+                Colors.print("\nReady to build!", Colors.BLUE)
+                return
+        except (OSError, ValueError, AttributeError):
+            # No cache yet, or unreadable/corrupt: fall through to a real check
+            pass
 
-    system = platform.system()
+    system = SYSTEM
     missing_deps = []
+
+    # Run the independent probes concurrently; results land in the lru caches used below.
+    # On Windows every probe is a lookup in the prebuilt PATH index, so there is nothing to overlap.
+    if system != "Windows":
+        probe_tools = ("cmake", "git", "clang++", "g++")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(probe_tools) + 1) as pool:
+            for tool in probe_tools:
+                pool.submit(command_exists, tool)
+            if system == "Linux":
+                pool.submit(check_pkg_config, "jsoncpp")
     
     # Check common tools
     if not command_exists("cmake"):
@@ -762,11 +1211,7 @@ def check_dependencies():
         install_cmd = "brew install"
         
         # Check jsoncpp in common locations
-        common_paths = [
-            "/opt/homebrew/lib/libjsoncpp.dylib",
-            "/usr/local/lib/libjsoncpp.dylib"
-        ]
-        if any(os.path.exists(p) for p in common_paths):
+        if any(os.path.exists(p) for p in JSONCPP_DYLIB_PATHS):
             jsoncpp_installed = True
             
         if not jsoncpp_installed:
@@ -777,27 +1222,19 @@ def check_dependencies():
         if not command_exists("g++") and not command_exists("clang++"):
             missing_deps.append("g++")
         
-        if not command_exists("pkg-config"):
+        if not PKG_CONFIG:
             missing_deps.append("pkg-config")
 
         # Distro detection
         jsoncpp_pkg = "jsoncpp (dev)"
-        if os.path.exists("/etc/os-release"):
-            try:
-                with open("/etc/os-release") as f:
-                    content = f.read().lower()
-                    if "ubuntu" in content or "debian" in content:
-                        install_cmd = "sudo apt-get install -y"
-                        jsoncpp_pkg = "libjsoncpp-dev"
-                    elif "arch" in content:
-                        install_cmd = "sudo pacman -S --noconfirm"
-                        jsoncpp_pkg = "jsoncpp"
-                    elif "fedora" in content:
-                        install_cmd = "sudo dnf install -y"
-                        jsoncpp_pkg = "jsoncpp-devel"
-            except:
-                pass
-             
+        os_release = read_os_release()
+        # Try ID first, then ID_LIKE, so derivatives (Mint, Manjaro, ...) map to their base distro
+        distro_ids = [os_release.get("ID", "").lower()] + os_release.get("ID_LIKE", "").lower().split()
+        for distro_id in distro_ids:
+            if distro_id in LINUX_DISTRO_PACKAGES:
+                install_cmd, jsoncpp_pkg = LINUX_DISTRO_PACKAGES[distro_id]
+                break
+
         if check_pkg_config("jsoncpp"):
             jsoncpp_installed = True
             
@@ -816,14 +1253,16 @@ def check_dependencies():
 
     if missing_deps:
         Colors.print("\nThe following dependencies appear to be missing:", Colors.RED)
-        for dep in missing_deps:
-            Colors.print(f"  - {dep}")
+        # One write per block rather than one per line
+        Colors.print("\n".join(f"  - {dep}" for dep in missing_deps))
         
         Colors.print("\nYou can try to install them via:", Colors.BLUE)
         if system == "Windows":
-             Colors.print("  Install Visual Studio Community with C++ workload.")
-             Colors.print("  Install CMake: winget install Kitware.CMake")
-             Colors.print("  Install Git: winget install Git.Git")
+             Colors.print("\n".join([
+                 "  Install Visual Studio Community with C++ workload.",
+                 "  Install CMake: winget install Kitware.CMake",
+                 "  Install Git: winget install Git.Git",
+             ]))
         else:
              deps_str = " ".join(missing_deps)
              if install_cmd:
@@ -835,6 +1274,274 @@ def check_dependencies():
     else:
         Colors.print("All dependencies seem to be present.", Colors.GREEN)
         Colors.print("\nReady to build!", Colors.BLUE)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w") as f:
+                json.dump({"key": cache_key, "time": time.time()}, f)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def _macos_clonefile():
+    """Return libSystem's clonefile(2), or None if it can't be loaded."""
+    import ctypes
+    try:
+        clonefile = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+def _copy_file_range(src, dst, size):
+    """Copy the size bytes of file src over dst in the kernel with copy_file_range.
+    Returns False, leaving dst as it was, when that is not possible for this pair (no
+    copy_file_range, or the first chunk fails, e.g. across filesystems on older kernels).
+    dst is only cut to the copied length at the end, never truncated up front; an error after
+    the first chunk is raised.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as fsrc:
+        try:
+            fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            created = True
+        except FileExistsError:
+            fd = os.open(dst, os.O_WRONLY)
+            created = False
+        try:
+            total = 0
+            while total < size:
+                try:
+                    copied = os.copy_file_range(fsrc.fileno(), fd, size - total)
+                except OSError:
+                    if total:
+                        raise
+                    if created:
+                        os.unlink(dst)
+                    return False
+                if copied == 0:
+                    break
+                total += copied
+            os.ftruncate(fd, total)
+        finally:
+            os.close(fd)
+    return True
+
+def fast_copy(src, dst):
+    """Drop-in for shutil.copy2 (also usable as copytree's copy_function) that clones the file when
+    the filesystem supports it: copy_file_range on Linux (a reflink on Btrfs/XFS, an in-kernel copy
+    elsewhere) and clonefile on APFS. Falls back to shutil.copy2, e.g. across filesystems.
+    Like copy2, raises shutil.SameFileError if src and dst are the same file.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    try:
+        if _copy_file_range(src, dst, os.stat(src).st_size):
+            shutil.copystat(src, dst)
+            return dst
+        if SYSTEM == "Darwin" and not os.path.lexists(dst):
+            clonefile = _macos_clonefile()
+            # clonefile carries over data, mode and timestamps, like copy2
+            if clonefile and clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return dst
+    except OSError:
+        pass
+    return shutil.copy2(src, dst)
+
+def _copy_entry(entry, dst):
+    """Copy the file behind scandir entry to dst using the stat the walk already cached: data via
+    copy_file_range (shutil.copyfile if unavailable), then mode and timestamps from that stat,
+    instead of fast_copy/copy2 statting the source again. APFS still goes through clonefile.
+    """
+    if SYSTEM == "Darwin":
+        return fast_copy(entry.path, dst)
+    st = entry.stat()
+    try:
+        copied = _copy_file_range(entry.path, dst, st.st_size)
+    except OSError:
+        copied = False
+    if not copied:
+        shutil.copyfile(entry.path, dst)
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
+def sync_tree(src, dst, ignore=None, copy_function=None):
+    """Mirror directory src into dst: copy files that are new or whose size/mtime differ, and
+    delete whatever in dst no longer exists in src. ignore works like copytree's ignore callable.
+    Files are copied with their timestamps, so an unchanged file costs one stat of each side.
+    copy_function(src, dst) overrides how files are copied (default: _copy_entry).
+    Returns the number of files copied.
+    """
+    copied = 0
+    stack = [(src, dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            entries = {entry.name: entry for entry in it}
+        if ignore:
+            for name in ignore(src_dir, list(entries)):
+                entries.pop(name, None)
+
+        with os.scandir(dst_dir) as it:
+            existing = {entry.name: entry for entry in it}
+        for name, old in existing.items():
+            new = entries.get(name)
+            if new is None or new.is_dir() != old.is_dir(follow_symlinks=False):
+                if old.is_dir(follow_symlinks=False):
+                    shutil.rmtree(old.path, onerror=remove_readonly)
+                else:
+                    os.chmod(old.path, stat.S_IWRITE)
+                    os.remove(old.path)
+                existing[name] = None
+
+        for name, entry in entries.items():
+            dst_path = os.path.join(dst_dir, name)
+            if entry.is_dir():
+                stack.append((entry.path, dst_path))
+                continue
+            old = existing.get(name)
+            if old is not None:
+                src_st, dst_st = entry.stat(), old.stat(follow_symlinks=False)
+                if src_st.st_size == dst_st.st_size and src_st.st_mtime_ns == dst_st.st_mtime_ns:
+                    continue
+                # The stale copy carries the source's old mode and may be read-only, which would
+                # make rewriting it in place fail; remove it like the deletion pass above does
+                os.chmod(old.path, stat.S_IWRITE)
+                os.remove(old.path)
+            if copy_function:
+                copy_function(entry.path, dst_path)
+            else:
+                _copy_entry(entry, dst_path)
+            copied += 1
+    return copied
+
+def copy_files(paths, dst_dir):
+    """Copy each file in paths into dst_dir with fast_copy, concurrently. Paths sharing a file
+    name are copied once, the last one winning as it would with sequential overwrites.
+    Returns the number of files copied.
+    """
+    by_name = {os.path.normcase(os.path.basename(p)): p for p in paths}
+    if not by_name:
+        return 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(by_name))) as pool:
+        # list() re-raises the first copy error, as the sequential loops did
+        list(pool.map(lambda src: fast_copy(src, dst_dir), by_name.values()))
+    return len(by_name)
+
+def collect_by_ext(dirpath, exts):
+    """Return paths of the files directly in dirpath whose (lowercased) name ends with one of exts.
+    One scandir per directory; a missing directory yields [].
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            return sorted(entry.path for entry in it if entry.name.lower().endswith(exts) and entry.is_file())
+    except OSError:
+        return []
+
+def collect_matching(dirpath, name_re):
+    """Like collect_by_ext, but selects the files whose name name_re finds a match in."""
+    try:
+        with os.scandir(dirpath) as it:
+            return sorted(entry.path for entry in it if name_re.search(entry.name) and entry.is_file())
+    except OSError:
+        return []
+
+
+# CMake multi-config generators (MSVC, Xcode) put binaries in one of these subdirectories
+BUILD_CONFIGS = ("Release", "Debug", "MinSizeRel", "RelWithDebInfo")
+
+def find_binary(build_dir, exe, config=None):
+    """Return the path of exe in build_dir or its first config subdirectory (BUILD_CONFIGS order)
+    that has it, else None. One scandir of build_dir shows which config dirs exist, so only
+    those are probed. If config (the configuration just built) is given, its subdirectory is
+    tried first so a stale binary from another configuration is not picked up.
+    """
+    try:
+        with os.scandir(build_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        return None
+    if config:
+        sub = entries.get(config)
+        if sub is not None and sub.is_dir() and os.path.isfile(os.path.join(sub.path, exe)):
+            return os.path.join(sub.path, exe)
+    top = entries.get(exe)
+    if top is not None and top.is_file():
+        return top.path
+    for cfg in BUILD_CONFIGS:
+        sub = entries.get(cfg)
+        if sub is not None and sub.is_dir():
+            candidate = os.path.join(sub.path, exe)
+            if os.path.isfile(candidate):
+                return candidate
+    return None
+
+
+def read_neutron_version(exe_path, cache_path):
+    """Return the x.y.z version printed by `exe_path --version`, or "unknown".
+    The result is cached in cache_path together with the binary's size and mtime, so the
+    executable is only spawned again after it has been rebuilt.
+    """
+    st = os.stat(exe_path)
+    key = f"{st.st_size} {st.st_mtime_ns}"
+    try:
+        with open(cache_path, 'r') as f:
+            cached_key, _, cached_version = f.read().partition("\n")
+        if cached_key == key and cached_version:
+            return cached_version
+    except OSError:
+        pass
+
+    version = "unknown"
+    try:
+        # Stream the output and stop at the first line carrying a version (normally the first
+        # line, e.g. "Neutron 1.2.3"); the rest of the banner is never read or waited for
+        proc = subprocess.Popen([exe_path, "--version"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            for line in proc.stdout:
+                m = VERSION_RE.search(line)
+                if m:
+                    version = m.group(1).decode()
+                    break
+        finally:
+            proc.stdout.close()
+            proc.terminate()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                # Ignored the terminate: kill it rather than leave it running or lose the version
+                proc.kill()
+                proc.wait()
+    except Exception:
+        return version
+
+    if version != "unknown":
+        try:
+            with open(cache_path, 'w') as f:
+                f.write(f"{key}\n{version}")
+        except OSError:
+            pass
+    return version
+
+
+def wait_for(probe, timeout=2.0, interval=0.05):
+    """Call probe() every interval seconds for up to timeout seconds (at least once) and return
+    its first truthy result, or None if nothing turns up in time.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = probe()
+        if result:
+            return result
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(interval)
 
 
 def main():
@@ -846,6 +1553,9 @@ def main():
     parser.add_argument("--debug", help="Build with debug symbols (CMAKE_BUILD_TYPE=Debug)", action="store_true")
     parser.add_argument("--clean", help="Clean build artifacts and exit", action="store_true")
     parser.add_argument("--check-deps", help="Check for required dependencies and exit", action="store_true")
+    parser.add_argument("--verify-bins", help="Smoke-test the built executables (neutron --version, box --help) before packaging", action="store_true")
+    parser.add_argument("--fresh", help="Reconfigure CMake from scratch and rebuild, even if the cache and binaries are up to date", action="store_true")
+    parser.add_argument("--refresh-deps", help="With --check-deps, ignore the cached result and probe again", action="store_true")
     args = parser.parse_args()
 
     if args.clean:
@@ -853,7 +1563,7 @@ def main():
         sys.exit(0)
         
     if args.check_deps:
-        check_dependencies()
+        check_dependencies(use_cache=not args.refresh_deps)
         sys.exit(0)
 
 
@@ -863,6 +1573,8 @@ def main():
     # Paths
     root_dir = os.getcwd()
     build_dir = os.path.join(root_dir, "build")
+    # MSVC's default configuration output, read by both the package and the installer steps
+    build_release_dir = os.path.join(build_dir, "Release")
     box_build_dir = os.path.join(root_dir, "nt-box", "build")
 
     # Binaries check
@@ -870,45 +1582,19 @@ def main():
     box_exe = "box.exe" if os_type == "windows" else "box"
     lsp_exe = "neutron-lsp.exe" if os_type == "windows" else "neutron-lsp"
 
-    # On Windows with MSVC, binaries might be in Release/ subdirectory
-    neutron_bin_paths = [
-        os.path.join(build_dir, neutron_exe),
-        os.path.join(build_dir, "Release", neutron_exe),
-        os.path.join(build_dir, "Debug", neutron_exe)
-    ]
-
-    box_bin_paths = [
-        os.path.join(box_build_dir, box_exe),
-        os.path.join(box_build_dir, "Release", box_exe),
-        os.path.join(box_build_dir, "Debug", box_exe)
-    ]
-
-    lsp_bin_paths = [
-        os.path.join(build_dir, lsp_exe),
-        os.path.join(build_dir, "Release", lsp_exe),
-        os.path.join(build_dir, "Debug", lsp_exe)
-    ]
-
     # Check if we need to build
     need_build = not args.skip_build
-    real_neutron_path = None
-    real_box_path = None
-    real_lsp_path = None
+    build_config = "Debug" if args.debug else "Release"
 
-    for p in neutron_bin_paths:
-        if os.path.exists(p):
-            real_neutron_path = p
-            break
+    # On Windows with MSVC, binaries might be in a Release/ (or other config) subdirectory
+    real_lsp_path = find_binary(build_dir, lsp_exe, build_config)
 
-    for p in box_bin_paths:
-        if os.path.exists(p):
-            real_box_path = p
-            break
-            
-    for p in lsp_bin_paths:
-        if os.path.exists(p):
-            real_lsp_path = p
-            break
+    # Nothing to rebuild if both projects last built this configuration and no source changed since
+    if (need_build and not args.fresh
+            and build_up_to_date(build_dir, build_config, root_dir, (neutron_exe,))
+            and build_up_to_date(box_build_dir, build_config, os.path.join(root_dir, "nt-box"), (box_exe,))):
+        Colors.print("Binaries are up to date with the sources; skipping build (--fresh forces a rebuild).", Colors.GREEN)
+        need_build = False
 
     if need_build:
         # Always build to ensure latest version
@@ -921,79 +1607,44 @@ def main():
                 Colors.print("Preflight checks failed. Either install the listed prerequisites or re-run with --skip-vcpkg to proceed (may still fail).", Colors.RED)
                 sys.exit(1)
 
-        # Build both executables
-        neutron_success = build_neutron(os_type, arch_type, build_dir, args.skip_vcpkg, args.debug)
-        box_success = build_box(os_type, arch_type, box_build_dir, args.skip_vcpkg, args.debug)
-
-        # Ensure we have found both binaries after building
-        # Wait a bit in case build process is still copying files
-        time.sleep(2)
+        # Build both executables. They use separate build directories and only share vcpkg, so
+        # initialise that first and then run the two builds concurrently: their configure steps
+        # take turns (CONFIGURE_LOCK) and the compiles split the cores rather than running
+        # 2x CPU_COUNT jobs
+        if os_type == 'windows' and not args.skip_vcpkg:
+            initialize_vcpkg(root_dir)
+        jobs = build_job_count(builds=2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            neutron_future = pool.submit(build_neutron, os_type, arch_type, build_dir, args.skip_vcpkg, args.debug, root_dir=root_dir, fresh=args.fresh, jobs=jobs)
+            box_future = pool.submit(build_box, os_type, arch_type, box_build_dir, args.skip_vcpkg, args.debug, root_dir=root_dir, fresh=args.fresh, jobs=jobs)
+            neutron_success = neutron_future.result()
+            box_success = box_future.result()
     else:
         Colors.print("Skipping build, using existing binaries...", Colors.BLUE)
         neutron_success = True
         box_success = True
 
-    # Ensure we have found both binaries after building
-    # Wait a bit in case build process is still copying files
-    time.sleep(2)
+    # Find binaries after build. A build that just finished may still be copying files,
+    # so poll briefly for them rather than sleeping a fixed amount
+    settle_timeout = 2.0 if need_build else 0
 
-    # Find binaries after build
-    real_neutron_path = None
-    real_box_path = None
+    real_neutron_path = wait_for(lambda: find_binary(build_dir, neutron_exe, build_config), settle_timeout)
+    if not real_neutron_path and os.path.isfile(os.path.join(root_dir, neutron_exe)):
+        real_neutron_path = os.path.join(root_dir, neutron_exe)  # In case build copied to root
 
-    # Try neutron paths first
-    for p in neutron_bin_paths:
-        if os.path.exists(p):
-            real_neutron_path = p
-            break
+    real_box_path = wait_for(lambda: find_binary(box_build_dir, box_exe, build_config), settle_timeout)
+    if not real_box_path and os.path.isfile(os.path.join(root_dir, box_exe)):
+        real_box_path = os.path.join(root_dir, box_exe)  # In case build copied to root
 
-    # If not found in standard locations, search in build directory more broadly
-    if not real_neutron_path:
-        neutron_search_paths = [
-            os.path.join(build_dir, "Release", neutron_exe),
-            os.path.join(build_dir, "Debug", neutron_exe),
-            os.path.join(build_dir, "MinSizeRel", neutron_exe),
-            os.path.join(build_dir, "RelWithDebInfo", neutron_exe),
-            os.path.join(root_dir, neutron_exe),  # In case build copied to root
-        ]
-        for p in neutron_search_paths:
-            if os.path.exists(p):
-                real_neutron_path = p
-                break
-
-    # Try box paths
-    for p in box_bin_paths:
-        if os.path.exists(p):
-            real_box_path = p
-            break
-
-    # If not found in standard locations, search in box build directory more broadly
-    if not real_box_path:
-        box_search_paths = [
-            os.path.join(box_build_dir, "Release", box_exe),
-            os.path.join(box_build_dir, "Debug", box_exe),
-            os.path.join(box_build_dir, "MinSizeRel", box_exe),
-            os.path.join(box_build_dir, "RelWithDebInfo", box_exe),
-            os.path.join(root_dir, box_exe),  # In case build copied to root
-        ]
-        for p in box_search_paths:
-            if os.path.exists(p):
-                real_box_path = p
-                break
-                
     if not real_lsp_path:
         # Check standard locations or try to build
         # We try to build it now if we can't find it
         if os.path.exists(build_dir):
              Colors.print("Attempting to build neutron-lsp target...", Colors.BLUE)
              cmake_exe = get_cmake_command()
-             build_config = "Debug" if args.debug else "Release"
              subprocess.call([cmake_exe, "--build", build_dir, "--target", "neutron-lsp", "--config", build_config])
              # Check again
-             for p in lsp_bin_paths:
-                if os.path.exists(p):
-                    real_lsp_path = p
-                    break
+             real_lsp_path = find_binary(build_dir, lsp_exe, build_config)
 
     # Check if both builds were successful and binaries exist
     if not real_neutron_path and not real_box_path:
@@ -1008,15 +1659,15 @@ def main():
     if not real_lsp_path:
         Colors.print("Warning: neutron-lsp executable not found.", Colors.YELLOW)
 
-    # Verify executables work (optional test)
-    if real_neutron_path and os.path.exists(real_neutron_path):
+    # Verify executables work (optional test; each check spawns the binary, so only on request)
+    if args.verify_bins and real_neutron_path and os.path.exists(real_neutron_path):
         try:
             subprocess.check_output([real_neutron_path, "--version"], timeout=10)
             Colors.print("Neutron executable verified successfully.", Colors.GREEN)
         except Exception as e:
             Colors.print(f"Neutron executable failed verification: {e}", Colors.YELLOW)
 
-    if real_box_path and os.path.exists(real_box_path):
+    if args.verify_bins and real_box_path and os.path.exists(real_box_path):
         try:
             subprocess.check_output([real_box_path, "--help"], timeout=10)
             Colors.print("Box executable verified successfully.", Colors.GREEN)
@@ -1030,43 +1681,49 @@ def main():
         target_name = f"neutron-{os_type}-{arch_type}"
         
     Colors.print(f"Creating package: {target_name}", Colors.BLUE)
-    
-    if os.path.exists(target_name):
-        shutil.rmtree(target_name, onerror=remove_readonly)
-    os.makedirs(target_name)
-    
-    # Copy binaries (only if present)
-    if real_neutron_path and os.path.exists(real_neutron_path):
-        shutil.copy2(real_neutron_path, target_name)
-    else:
-        Colors.print("Skipping copy of neutron executable (not found).", Colors.YELLOW)
 
-    if real_box_path and os.path.exists(real_box_path):
-        shutil.copy2(real_box_path, target_name)
+    # Asset files and trees staged into the package (see "Copy assets" below)
+    items_to_copy = ["README.md", "LICENSE", "docs", "include", "src", "libs", "nt-box"]
+
+    # Reuse an existing package directory: the asset trees in it are synced incrementally below,
+    # everything else (binaries, libraries, scripts) is removed and staged afresh
+    if os.path.exists(target_name):
+        with os.scandir(target_name) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in items_to_copy:
+                        shutil.rmtree(entry.path, onerror=remove_readonly)
+                else:
+                    os.chmod(entry.path, stat.S_IWRITE)
+                    os.remove(entry.path)
     else:
-        Colors.print("Skipping copy of box executable (not found).", Colors.YELLOW)
+        os.makedirs(target_name)
     
-    # Copy executables
+    # Copy executables (only if present)
     def format_bin_dst(name):
         return os.path.join(target_name, name)
 
     if real_neutron_path and os.path.exists(real_neutron_path):
-        shutil.copy2(real_neutron_path, format_bin_dst(neutron_exe))
+        bin_dst = fast_copy(real_neutron_path, format_bin_dst(neutron_exe))
         # On Linux/macOS, chmod +x
         if os_type != "windows":
-            os.chmod(format_bin_dst(neutron_exe), 0o755)
+            os.chmod(bin_dst, 0o755)
+    else:
+        Colors.print("Skipping copy of neutron executable (not found).", Colors.YELLOW)
             
     if real_box_path and os.path.exists(real_box_path):
-        shutil.copy2(real_box_path, format_bin_dst(box_exe))
+        bin_dst = fast_copy(real_box_path, format_bin_dst(box_exe))
         # On Linux/macOS, chmod +x
         if os_type != "windows":
-            os.chmod(format_bin_dst(box_exe), 0o755)
+            os.chmod(bin_dst, 0o755)
+    else:
+        Colors.print("Skipping copy of box executable (not found).", Colors.YELLOW)
             
     if real_lsp_path and os.path.exists(real_lsp_path):
-        shutil.copy2(real_lsp_path, format_bin_dst(lsp_exe))
+        bin_dst = fast_copy(real_lsp_path, format_bin_dst(lsp_exe))
         # On Linux/macOS, chmod +x
         if os_type != "windows":
-            os.chmod(format_bin_dst(lsp_exe), 0o755)
+            os.chmod(bin_dst, 0o755)
     
     # Create lib directory and copy runtime library
     lib_dir = os.path.join(target_name, "lib")
@@ -1075,66 +1732,60 @@ def main():
     # Libraries stuff
     if os_type == "windows":
         Colors.print(f"Copying libraries to {lib_dir}...", Colors.BLUE)
-        num_copied = 0
         
         # Copy runtime library to lib directory
-        # Check standard MSVC locations
-        search_paths = [
-            os.path.join(build_dir, "*.lib"),
-            os.path.join(build_dir, "neutron.lib"), # Import library for the executable
-            os.path.join(build_dir, "Release", "*.lib"),
-            os.path.join(build_dir, "Release", "neutron.lib"),
-            os.path.join(build_dir, "MinSizeRel", "*.lib"),
-            os.path.join(build_dir, "RelWithDebInfo", "*.lib"),
-            os.path.join(build_dir, "*.a") # Just in case
-        ]
-        
-        for p in search_paths:
-            for lib_file in glob.glob(p):
-                print(f"  Copying {lib_file}")
-                # Copy to root directory instead of lib/ so it's with the executable
-                shutil.copy2(lib_file, target_name)
-                num_copied += 1
+        # Check standard MSVC locations (the neutron.lib import library is among the *.lib files).
+        # Each directory is listed once for both its libraries and its DLLs.
+        build_files = collect_by_ext(build_dir, (".lib", ".a", ".dll"))  # .a just in case
+        release_files = collect_by_ext(build_release_dir, (".lib", ".dll"))
+        lib_files = [f for f in build_files + release_files if not f.lower().endswith(".dll")]
+        for config in ("MinSizeRel", "RelWithDebInfo"):
+            lib_files += collect_by_ext(os.path.join(build_dir, config), (".lib",))
+
+        for lib_file in lib_files:
+            print(f"  Copying {lib_file}")
+        # Copy to root directory instead of lib/ so it's with the executable
+        num_copied = copy_files(lib_files, target_name)
                 
         if num_copied == 0:
              Colors.print("WARNING: No .lib or .a files found to copy!", Colors.YELLOW)
 
         # Copy DLLs from build dir if any
         # With MSVC dynamic linking, we might rely on system installed runtimes or vcpkg dlls
-        # Search for .dll in build dir
-        for dll in glob.glob(os.path.join(build_dir, "*.dll")):
-             shutil.copy2(dll, target_name)
-        for dll in glob.glob(os.path.join(build_dir, "Release", "*.dll")):
-             shutil.copy2(dll, target_name)
+        copy_files([dll for dll in build_files + release_files if dll.lower().endswith(".dll")], target_name)
     else:
         # Unix
         # Copy libneutron_runtime to lib directory
-        lib_extensions = ["a", "so", "dylib"]
-        for ext in lib_extensions:
-            for f in glob.glob(os.path.join(build_dir, f"*.{ext}*")):
-                shutil.copy2(f, target_name)
+        copy_files(collect_matching(build_dir, UNIX_LIB_RE), target_name)
     
-    # Copy assets
-    items_to_copy = ["README.md", "LICENSE", "docs", "include", "src", "libs", "nt-box"]
-    
-    for item in items_to_copy:
+    # Copy assets (trees are synced against what a previous run left in the package)
+    def copy_item(item):
         src_path = os.path.join(root_dir, item)
+        dst_path = os.path.join(target_name, item)
         if os.path.exists(src_path):
-            dst_path = os.path.join(target_name, item)
             if os.path.isdir(src_path):
                 # For nt-box, exclude build artifacts and git
                 if item == "nt-box":
-                    shutil.copytree(src_path, dst_path, ignore=shutil.ignore_patterns('build', '.git', '*.o', '*.obj', '*.exe', '*.dll'))
+                    sync_tree(src_path, dst_path, ignore=shutil.ignore_patterns('build', '.git', '*.o', '*.obj', '*.exe', '*.dll'))
                 else:
-                    shutil.copytree(src_path, dst_path)
+                    sync_tree(src_path, dst_path)
             else:
-                shutil.copy2(src_path, target_name)
+                fast_copy(src_path, target_name)
+        elif os.path.isdir(dst_path):
+            # Gone from the source since the last package: drop the stale copy
+            shutil.rmtree(dst_path, onerror=remove_readonly)
+
+    # The items are independent trees and copying is I/O-bound, so copy them concurrently;
+    # result() re-raises any copy error here, as the sequential loop did
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(items_to_copy))) as pool:
+        for future in [pool.submit(copy_item, item) for item in items_to_copy]:
+            future.result()
     
     # Copy install.sh for Linux/macOS
     if os_type in ["linux", "macos"]:
         install_script = os.path.join(root_dir, "scripts", "install.sh")
         if os.path.exists(install_script):
-            shutil.copy2(install_script, target_name)
+            fast_copy(install_script, target_name)
             # Make it executable
             os.chmod(os.path.join(target_name, "install.sh"), 0o755)
             Colors.print("Added install.sh script", Colors.GREEN)
@@ -1159,7 +1810,7 @@ def main():
                 
                 # Copy .vsix to output
                 for vsix in glob.glob(os.path.join(extension_dir, "*.vsix")):
-                     shutil.copy2(vsix, target_name)
+                     fast_copy(vsix, target_name)
                      Colors.print(f"Copied {os.path.basename(vsix)} to package", Colors.GREEN)
             except Exception as e:
                 Colors.print(f"Failed to build VS Code extension: {e}", Colors.YELLOW)
@@ -1169,15 +1820,7 @@ def main():
     # Version check (only if neutron executable present)
     version = "unknown"
     if real_neutron_path and os.path.exists(real_neutron_path):
-        try:
-            output = subprocess.check_output([real_neutron_path, "--version"]).decode().strip()
-            # Simple extraction if output is like "Neutron 1.2.3"
-            import re
-            m = re.search(r'(\d+\.\d+\.\d+)', output)
-            if m:
-                version = m.group(1)
-        except Exception:
-            version = "unknown"
+        version = read_neutron_version(real_neutron_path, os.path.join(build_dir, ".nt-version"))
     else:
         Colors.print("Neutron executable not available; setting package version to 'unknown'", Colors.YELLOW)
 
@@ -1216,64 +1859,56 @@ def main():
              
          # Copy binaries and libs to root for NSIS to find (only if they exist)
          if real_neutron_path and os.path.exists(real_neutron_path):
-             shutil.copy2(real_neutron_path, root_dir)
-             Colors.print(f"Copied {real_neutron_path} to root", Colors.GREEN)
+             try:
+                 fast_copy(real_neutron_path, root_dir)
+                 Colors.print(f"Copied {real_neutron_path} to root", Colors.GREEN)
+             except shutil.SameFileError:
+                 pass  # Found in (or copied to) the root by the build already
          else:
              Colors.print("WARNING: neutron executable not present; installer will not include it.", Colors.YELLOW)
              
          if real_box_path and os.path.exists(real_box_path):
-             shutil.copy2(real_box_path, root_dir)
-             Colors.print(f"Copied {real_box_path} to root", Colors.GREEN)
+             try:
+                 fast_copy(real_box_path, root_dir)
+                 Colors.print(f"Copied {real_box_path} to root", Colors.GREEN)
+             except shutil.SameFileError:
+                 pass  # Found in (or copied to) the root by the build already
          else:
              Colors.print("WARNING: box executable not present; installer will not include it.", Colors.YELLOW)
              
          if real_lsp_path and os.path.exists(real_lsp_path):
-             shutil.copy2(real_lsp_path, root_dir)
-             Colors.print(f"Copied {real_lsp_path} to root", Colors.GREEN)
+             try:
+                 fast_copy(real_lsp_path, root_dir)
+                 Colors.print(f"Copied {real_lsp_path} to root", Colors.GREEN)
+             except shutil.SameFileError:
+                 pass  # Found in (or copied to) the root by the build already
          else:
              Colors.print("WARNING: lsp executable not present; installer will not include it.", Colors.YELLOW)
          
          # Copy DLLs (needed for vcpkg dynamic linking)
          dll_count = 0
          
-         # Copy DLLs from build directory
-         for dll in glob.glob(os.path.join(build_dir, "Release", "*.dll")):
-             shutil.copy2(dll, root_dir)
-             dll_count += 1
-         for dll in glob.glob(os.path.join(build_dir, "*.dll")):
-             shutil.copy2(dll, root_dir)
-             dll_count += 1
+         # Copy DLLs from build directory; list each directory once for its DLLs and LIBs
+         release_files = collect_by_ext(build_release_dir, (".dll", ".lib"))
+         build_files = collect_by_ext(build_dir, (".dll", ".lib"))
+         dll_count += copy_files([dll for dll in release_files + build_files if dll.lower().endswith(".dll")], root_dir)
              
-         # Copy vcpkg DLLs (for neutron-lsp dependencies)
-         vcpkg_bin_dir = os.path.join(root_dir, "vcpkg", "installed", "x64-windows", "bin")
-         if os.path.exists(vcpkg_bin_dir):
+         # Copy vcpkg DLLs (for neutron-lsp dependencies), also trying the alternative vcpkg path structure
+         vcpkg_dlls = []
+         for vcpkg_bin_dir in (os.path.join(root_dir, "vcpkg", "installed", "x64-windows", "bin"),
+                               os.path.join(build_dir, "vcpkg_installed", "x64-windows", "bin")):
              for dll_name in ["jsoncpp.dll", "libcurl.dll", "zlib1.dll"]:
                  dll_path = os.path.join(vcpkg_bin_dir, dll_name)
                  if os.path.exists(dll_path):
-                     shutil.copy2(dll_path, root_dir)
-                     dll_count += 1
-                     Colors.print(f"Copied vcpkg DLL: {dll_name}", Colors.GREEN)
-         
-         # Try alternative vcpkg path structure
-         vcpkg_bin_dir2 = os.path.join(build_dir, "vcpkg_installed", "x64-windows", "bin")
-         if os.path.exists(vcpkg_bin_dir2):
-             for dll_name in ["jsoncpp.dll", "libcurl.dll", "zlib1.dll"]:
-                 dll_path = os.path.join(vcpkg_bin_dir2, dll_name)
-                 if os.path.exists(dll_path):
-                     shutil.copy2(dll_path, root_dir)
-                     dll_count += 1
-                     Colors.print(f"Copied vcpkg DLL: {dll_name}", Colors.GREEN)
+                     vcpkg_dlls.append(dll_path)
+         dll_count += copy_files(vcpkg_dlls, root_dir)
+         for dll_name in sorted({os.path.basename(p) for p in vcpkg_dlls}):
+             Colors.print(f"Copied vcpkg DLL: {dll_name}", Colors.GREEN)
          
          Colors.print(f"Copied {dll_count} DLL files total", Colors.GREEN)
          
          # Copy runtime lib if it exists
-         lib_count = 0
-         for lib_file in glob.glob(os.path.join(build_dir, "*.lib")):
-             shutil.copy2(lib_file, root_dir)
-             lib_count += 1
-         for lib_file in glob.glob(os.path.join(build_dir, "Release", "*.lib")):
-             shutil.copy2(lib_file, root_dir)
-             lib_count += 1
+         lib_count = copy_files([f for f in build_files + release_files if f.lower().endswith(".lib")], root_dir)
          Colors.print(f"Copied {lib_count} LIB files", Colors.GREEN)
 
          # Sanitize installer.nsi by commenting out File lines that glob to nothing